@@ -1,50 +1,402 @@
 from flask import Flask, request, jsonify, render_template
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from cachetools import TTLCache
 import sqlite3
 from datetime import datetime, timedelta
 import os
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import atexit
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
 from functools import wraps
-import hashlib
+from pathlib import Path
 import secrets
 from werkzeug.exceptions import BadRequest
 import json
+import orjson
 
-# Configure logging
+# Configure logging; records are queued and written by a background thread
+# so request handlers never wait on file or console I/O
+_log_file_handler = logging.FileHandler('app.log')
+_log_file_handler.setLevel(logging.WARNING)  # Per-request INFO goes to the console only
+_log_stream_handler = logging.StreamHandler()
+_log_queue_handler = QueueHandler(queue.Queue(-1))
+_log_listener = None
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('app.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[_log_queue_handler]
 )
 
+def start_log_listener():
+    """Start the thread that writes queued log records.
+
+    Each call uses a fresh queue, so a forked worker never shares the
+    parent's queue or depends on the parent's listener thread.
+    """
+    global _log_listener
+    _log_queue_handler.queue = queue.Queue(-1)
+    _log_listener = QueueListener(
+        _log_queue_handler.queue,
+        _log_file_handler,
+        _log_stream_handler,
+        respect_handler_level=True
+    )
+    _log_listener.start()
+
+def stop_log_listener():
+    """Flush queued log records and stop the listener thread."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+start_log_listener()
+atexit.register(stop_log_listener)
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for request parsing and jsonify.
+
+    Dates and dataclasses are passed through to Flask's ``default`` so they
+    keep Flask's output (HTTP dates, ``asdict``) rather than orjson's own.
+    """
+
+    _DUMPS_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self._DUMPS_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 CORS(app)  # Enable CORS for frontend integration
 
 # Configuration
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', secrets.token_hex(32))
 app.config['DATABASE_PATH'] = os.environ.get('DB_PATH', os.path.join("database", "results.db"))
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+app.config['DB_POOL_SIZE'] = int(os.environ.get('DB_POOL_SIZE', max(4, os.cpu_count() or 1)))
+app.config['DB_POOL_TIMEOUT'] = float(os.environ.get('DB_POOL_TIMEOUT', 5.0))  # seconds
+app.config['INSERT_BATCH_SIZE'] = int(os.environ.get('INSERT_BATCH_SIZE', 64))
+app.config['INSERT_BATCH_WAIT'] = float(os.environ.get('INSERT_BATCH_WAIT', 0.005))  # seconds
+app.config['STATS_CACHE_SIZE'] = int(os.environ.get('STATS_CACHE_SIZE', 1024))
+app.config['STATS_CACHE_TTL'] = float(os.environ.get('STATS_CACHE_TTL', 30))  # seconds
+
+# Applied to every pooled connection when it is opened
+SQLITE_PRAGMAS = '''
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA mmap_size=268435456;
+'''
+
+# Columns returned by /get-results, in SELECT order
+RESULT_COLUMNS = (
+    "id", "username", "confidence_score", "knowledge_score", "final_score",
+    "feedback", "question_answered", "session_id", "created_at"
+)
+
+# SQL is kept in fixed strings so sqlite3's per-connection statement
+# cache reuses the compiled statement instead of re-parsing it per request.
+SQL_INSERT_RESULT = '''
+    INSERT INTO results
+    (username, confidence_score, knowledge_score, final_score, feedback, question_answered, session_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+SQL_INSERT_SESSION = '''
+    INSERT INTO user_sessions (session_id, username)
+    VALUES (?, ?)
+'''
+
+# Aggregates and the five most recent results in one statement; the recent
+# rows come back as a JSON array in the recent_results column
+SQL_USER_STATS = '''
+    WITH recent AS (
+        SELECT confidence_score, knowledge_score, final_score, created_at
+        FROM results 
+        WHERE username = ? 
+        ORDER BY created_at DESC 
+        LIMIT 5
+    )
+    SELECT 
+        COUNT(*) as total_attempts,
+        AVG(confidence_score) as avg_confidence,
+        AVG(knowledge_score) as avg_knowledge,
+        AVG(final_score) as avg_final_score,
+        MAX(final_score) as best_score,
+        MIN(final_score) as worst_score,
+        MAX(created_at) as last_attempt,
+        MAX(id) as last_id,
+        (
+            SELECT json_group_array(json_object(
+                'confidence_score', confidence_score,
+                'knowledge_score', knowledge_score,
+                'final_score', final_score,
+                'created_at', created_at
+            ))
+            FROM recent
+        ) as recent_results
+    FROM results 
+    WHERE username = ?
+'''
+
+# Newest id and row count for one user; answered from idx_results_user_created
+# alone and used to validate cached /get-user-stats responses
+SQL_USER_VERSION = "SELECT MAX(id), COUNT(*) FROM results WHERE username = ?"
+
+# RETURNING (SQLite 3.35+) reports the deleted row's owner in the same statement
+SQL_DELETE_RESULT = "DELETE FROM results WHERE id = ? RETURNING username"
+
+# /get-results WHERE clauses keyed by (username match, filter by days); the
+# username match is None, "like" (substring search) or "exact", which can be
+# served directly by idx_results_user_created
+_RESULTS_FILTERS = {
+    (None, False): "",
+    (None, True): " WHERE created_at >= ?",
+    ("like", False): " WHERE username LIKE ?",
+    ("like", True): " WHERE username LIKE ? AND created_at >= ?",
+    ("exact", False): " WHERE username = ?",
+    ("exact", True): " WHERE username = ? AND created_at >= ?",
+}
+
+SQL_SELECT_RESULTS = {
+    key: f"SELECT {', '.join(RESULT_COLUMNS)} FROM results{where}"
+         " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+    for key, where in _RESULTS_FILTERS.items()
+}
+
+# Newest id and row count for a filter combination: the ETag for /get-results
+# and the pagination total in one cheap aggregate
+SQL_RESULTS_VERSION = {
+    key: f"SELECT MAX(id), COUNT(*) FROM results{where}"
+    for key, where in _RESULTS_FILTERS.items()
+}
 
 # Ensure database directory exists
 os.makedirs(os.path.dirname(app.config['DATABASE_PATH']), exist_ok=True)
 
-def get_db_connection():
-    """Create and return a database connection."""
-    try:
-        conn = sqlite3.connect(app.config['DATABASE_PATH'])
+class SQLitePool:
+    """One writer connection plus a fixed-size pool of read-only connections.
+
+    SQLite allows a single writer at a time, so writes are serialized on a
+    lock while readers run concurrently against the WAL snapshot.
+    """
+
+    def __init__(self, database, size, timeout=5.0):
+        self.database = database
+        self.timeout = timeout
+        self._write_lock = threading.Lock()
+        # The writer opens first so the file exists and WAL is enabled
+        # before the read-only connections attach.
+        self._writer = self._connect(database)
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        read_uri = Path(database).resolve().as_uri() + "?mode=ro"
+        self._readers = [self._connect(read_uri, uri=True) for _ in range(size)]
+        self._idle = queue.Queue()
+        for conn in self._readers:
+            conn.execute("PRAGMA query_only=1")
+            self._idle.put(conn)
+
+    def _connect(self, database, uri=False):
+        conn = sqlite3.connect(database, uri=uri, timeout=self.timeout, check_same_thread=False)
+        conn.executescript(SQLITE_PRAGMAS)
         conn.row_factory = sqlite3.Row  # Enable dict-like access
         return conn
-    except sqlite3.Error as e:
-        app.logger.error(f"Database connection error: {e}")
-        raise
+
+    @contextmanager
+    def acquire_read(self):
+        """Check out a read-only connection."""
+        try:
+            conn = self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError("Timed out waiting for a read connection")
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._idle.put(conn)
+
+    @contextmanager
+    def acquire_write(self):
+        """Hold the writer connection; commits on success, rolls back on error."""
+        if not self._write_lock.acquire(timeout=self.timeout):
+            raise sqlite3.OperationalError("Timed out waiting for the write connection")
+        try:
+            with self._writer:
+                yield self._writer
+        finally:
+            self._write_lock.release()
+
+    def close(self):
+        """Close the writer and every pooled reader."""
+        for conn in self._readers:
+            conn.close()
+        self._readers = []
+        self._writer.close()
+
+class InsertBatcher:
+    """Coalesces result inserts from concurrent requests into shared transactions.
+
+    A daemon thread collects up to ``max_batch`` rows (waiting at most
+    ``max_wait`` seconds after the first) and writes them with a single
+    commit, so the fsync cost is paid once per batch instead of per request.
+    """
+
+    # Errors caused by one row's values (constraint violations, unbindable or
+    # out-of-range parameters); only these are worth retrying row by row
+    ROW_ERRORS = (
+        sqlite3.IntegrityError,
+        sqlite3.InterfaceError,
+        sqlite3.ProgrammingError,
+        sqlite3.DataError,
+        OverflowError,
+    )
+
+    def __init__(self, pool, max_batch=64, max_wait=0.005):
+        self._pool = pool
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="insert-batcher", daemon=True)
+        self._thread.start()
+
+    def insert(self, row):
+        """Queue a results row and block until it is committed; returns its id."""
+        future = Future()
+        self._queue.put((row, future))
+        try:
+            # Allow for a full wait on the writer lock plus the batch write itself
+            return future.result(timeout=self._pool.timeout * 2)
+        except TimeoutError:
+            # Withdraw the row so a retry after the error cannot duplicate it
+            if future.cancel():
+                raise sqlite3.OperationalError("Timed out waiting for batched insert")
+        # Too late to cancel: the write is already underway, so report its outcome
+        return future.result()
+
+    def close(self):
+        """Flush queued rows and stop the worker thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        running = True
+        while running:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is None:
+                    running = False
+                    break
+                batch.append(item)
+            # Skip rows whose request already gave up; the rest can no longer be cancelled
+            batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+            if batch:
+                self._flush(batch)
+
+    def _flush(self, batch):
+        try:
+            ids = self._write([row for row, _ in batch])
+        except self.ROW_ERRORS as e:
+            if len(batch) == 1:
+                batch[0][1].set_exception(e)
+            else:
+                # Retry one by one so a single bad row does not fail the others
+                for item in batch:
+                    self._flush([item])
+            return
+        except Exception as e:
+            # Lock/busy timeouts and the like would hit every retry too; fail fast
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), result_id in zip(batch, ids):
+            future.set_result(result_id)
+
+    def _write(self, rows):
+        with self._pool.acquire_write() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(SQL_INSERT_RESULT, rows)
+            # AUTOINCREMENT ids are consecutive within a single write transaction
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return range(last_id - len(rows) + 1, last_id + 1)
+
+class UserStatsCache:
+    """TTL-LRU cache of ``(etag, body)`` /get-user-stats responses keyed by username.
+
+    Write paths call ``invalidate`` after committing. A generation counter
+    keeps a response computed before a concurrent write from being stored.
+    Hits are still checked against the user's current version, because each
+    gunicorn worker has its own cache and only sees its own invalidations.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def get(self, username):
+        """Return ``(entry, generation)``; ``entry`` is None on a miss."""
+        with self._lock:
+            return self._cache.get(username), self._generation
+
+    def set(self, username, entry, generation):
+        with self._lock:
+            if generation == self._generation:
+                self._cache[username] = entry
+
+    def invalidate(self, username):
+        """Drop a user's entry after a write that touched their results."""
+        with self._lock:
+            self._generation += 1
+            self._cache.pop(username, None)
+
+app.extensions['stats_cache'] = UserStatsCache(
+    app.config['STATS_CACHE_SIZE'],
+    app.config['STATS_CACHE_TTL']
+)
+
+def get_db_connection(write=False):
+    """Check out a pooled database connection (use as a context manager).
+
+    Pass ``write=True`` for statements that modify the database.
+    """
+    pool = app.extensions['sqlite_pool']
+    return pool.acquire_write() if write else pool.acquire_read()
 
 def init_db():
-    """Initialize the database with required tables."""
+    """Open the connection pool and initialize the database with required tables."""
     try:
-        with get_db_connection() as conn:
+        if 'sqlite_pool' not in app.extensions:
+            pool = SQLitePool(
+                app.config['DATABASE_PATH'],
+                app.config['DB_POOL_SIZE'],
+                timeout=app.config['DB_POOL_TIMEOUT']
+            )
+            app.extensions['sqlite_pool'] = pool
+        if 'insert_batcher' not in app.extensions:
+            batcher = InsertBatcher(
+                app.extensions['sqlite_pool'],
+                max_batch=app.config['INSERT_BATCH_SIZE'],
+                max_wait=app.config['INSERT_BATCH_WAIT']
+            )
+            app.extensions['insert_batcher'] = batcher
+        with get_db_connection(write=True) as conn:
             conn.executescript('''
                 CREATE TABLE IF NOT EXISTS results (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -67,9 +419,13 @@ def init_db():
                     last_activity TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 );
 
-                CREATE INDEX IF NOT EXISTS idx_results_username ON results(username);
                 CREATE INDEX IF NOT EXISTS idx_results_created_at ON results(created_at);
+                CREATE INDEX IF NOT EXISTS idx_results_user_created ON results(username, created_at DESC);
                 CREATE INDEX IF NOT EXISTS idx_sessions_session_id ON user_sessions(session_id);
+
+                -- Covered by the indexes above; dropped so inserts maintain fewer B-trees
+                DROP INDEX IF EXISTS idx_results_username;
+                DROP INDEX IF EXISTS idx_results_created_desc;
             ''')
             conn.commit()
         app.logger.info("Database initialized successfully")
@@ -77,6 +433,22 @@ def init_db():
         app.logger.error(f"Database initialization error: {e}")
         raise
 
+def close_db():
+    """Flush pending inserts and close pooled connections; safe to call repeatedly."""
+    batcher = app.extensions.pop('insert_batcher', None)
+    if batcher is not None:
+        batcher.close()
+    pool = app.extensions.pop('sqlite_pool', None)
+    if pool is not None:
+        pool.close()
+
+atexit.register(close_db)
+
+def create_app():
+    """Application factory for WSGI servers (see gunicorn.conf.py)."""
+    init_db()
+    return app
+
 def validate_json_data(required_fields):
     """Decorator to validate JSON data and required fields."""
     def decorator(f):
@@ -100,31 +472,69 @@ def validate_json_data(required_fields):
         return decorated_function
     return decorator
 
+_timestamp_cache = (0, "")
+
+def utc_timestamp():
+    """Current UTC time as an ISO-8601 string, formatted at most once per second."""
+    global _timestamp_cache
+    second = int(time.time())
+    cached_second, value = _timestamp_cache
+    if cached_second != second:
+        value = datetime.utcfromtimestamp(second).isoformat()
+        _timestamp_cache = (second, value)
+    return value
+
+def json_response(body, etag):
+    """Response for an encoded JSON body, or an empty 304 if the client already has ``etag``."""
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(body, mimetype=app.json.mimetype)
+    response.set_etag(etag, weak=True)
+    return response
+
+def as_int(value):
+    """Convert a JSON value to int, skipping the call when it already is one."""
+    return value if type(value) is int else int(value)
+
 def generate_session_id():
     """Generate a unique session ID."""
-    return hashlib.sha256(f"{datetime.utcnow().isoformat()}{secrets.token_hex(16)}".encode()).hexdigest()
+    return secrets.token_urlsafe(32)
+
+# Fixed error bodies, encoded once at import
+_NOT_FOUND_BODY = orjson.dumps({"error": "Resource not found"})
+_INTERNAL_ERROR_BODY = orjson.dumps({"error": "Internal server error"})
 
 @app.errorhandler(404)
 def not_found_error(error):
-    return jsonify({"error": "Resource not found"}), 404
+    return app.response_class(_NOT_FOUND_BODY, status=404, mimetype=app.json.mimetype)
 
 @app.errorhandler(500)
 def internal_error(error):
     app.logger.error(f"Internal server error: {error}")
-    return jsonify({"error": "Internal server error"}), 500
+    return app.response_class(_INTERNAL_ERROR_BODY, status=500, mimetype=app.json.mimetype)
 
 @app.errorhandler(BadRequest)
 def bad_request_error(error):
     return jsonify({"error": "Bad request", "message": str(error)}), 400
 
+# (timestamp, encoded body) of the last health check response
+_index_cache = ("", b"")
+
 @app.route("/", methods=["GET"])
 def index():
-    """Health check endpoint."""
-    return jsonify({
-        "message": "Interview Prep API is running",
-        "version": "2.0",
-        "timestamp": datetime.utcnow().isoformat()
-    })
+    """Health check endpoint; the body is re-encoded only when utc_timestamp() changes."""
+    global _index_cache
+    timestamp = utc_timestamp()
+    cached_timestamp, body = _index_cache
+    if cached_timestamp != timestamp:
+        body = orjson.dumps({
+            "message": "Interview Prep API is running",
+            "version": "2.0",
+            "timestamp": timestamp
+        })
+        _index_cache = (timestamp, body)
+    return app.response_class(body, mimetype=app.json.mimetype)
 
 @app.route("/create-session", methods=["POST"])
 @validate_json_data(["username"])
@@ -141,11 +551,8 @@ def create_session(data):
     session_id = generate_session_id()
     
     try:
-        with get_db_connection() as conn:
-            conn.execute('''
-                INSERT INTO user_sessions (session_id, username)
-                VALUES (?, ?)
-            ''', (session_id, username))
+        with get_db_connection(write=True) as conn:
+            conn.execute(SQL_INSERT_SESSION, (session_id, username))
             conn.commit()
         
         app.logger.info(f"Session created for user: {username}")
@@ -166,8 +573,8 @@ def save_result(data):
     try:
         # Extract and validate data
         username = data.get("username", "Anonymous").strip()
-        confidence = int(data.get("confidence_score"))
-        knowledge = int(data.get("knowledge_score"))
+        confidence = as_int(data.get("confidence_score"))
+        knowledge = as_int(data.get("knowledge_score"))
         feedback_list = data.get("feedback", [])
         question_answered = data.get("question_answered", "")
         session_id = data.get("session_id")
@@ -185,23 +592,26 @@ def save_result(data):
         # Calculate final score
         final_score = int((confidence + knowledge) / 2)
         
-        # Process feedback
-        if isinstance(feedback_list, list):
-            feedback = ", ".join(str(item) for item in feedback_list if item)
-        else:
-            feedback = str(feedback_list) if feedback_list else ""
+        # Process feedback; the common case is a list of non-empty strings,
+        # which can be joined directly without the per-item filter
+        feedback = None
+        if type(feedback_list) is list and "" not in feedback_list:
+            try:
+                feedback = ", ".join(feedback_list)
+            except TypeError:
+                pass  # Mixed item types; handled below
+        if feedback is None:
+            if isinstance(feedback_list, list):
+                feedback = ", ".join(str(item) for item in feedback_list if item)
+            else:
+                feedback = str(feedback_list) if feedback_list else ""
         
-        # Save to database
-        with get_db_connection() as conn:
-            cursor = conn.execute('''
-                INSERT INTO results 
-                (username, confidence_score, knowledge_score, final_score, feedback, question_answered, session_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (username, confidence, knowledge, final_score, feedback, question_answered, session_id))
-            
-            result_id = cursor.lastrowid
-            conn.commit()
+        # Save to database (batched with concurrent requests)
+        result_id = app.extensions['insert_batcher'].insert(
+            (username, confidence, knowledge, final_score, feedback, question_answered, session_id)
+        )
         
+        app.extensions['stats_cache'].invalidate(username)
         app.logger.info(f"Result saved for user {username} with final score {final_score}")
         
         return jsonify({
@@ -209,7 +619,7 @@ def save_result(data):
             "result_id": result_id,
             "final_score": final_score,
             "username": username,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_timestamp()
         }), 201
         
     except ValueError as e:
@@ -229,6 +639,7 @@ def get_results():
         page = int(request.args.get('page', 1))
         per_page = min(int(request.args.get('per_page', 10)), 100)  # Max 100 results per page
         username = request.args.get('username', '').strip()
+        exact = request.args.get('exact', '').lower() in ('1', 'true', 'yes')
         days = request.args.get('days', type=int)
         
         # Pagination validation
@@ -237,67 +648,42 @@ def get_results():
         if per_page < 1:
             return jsonify({"error": "Per page must be >= 1"}), 400
         
-        # Build query
-        query = '''
-            SELECT id, username, confidence_score, knowledge_score, final_score, 
-                   feedback, question_answered, session_id, created_at
-            FROM results
-        '''
         params = []
-        conditions = []
         
         # Add filters
         if username:
-            conditions.append("username LIKE ?")
-            params.append(f"%{username}%")
+            params.append(username if exact else f"%{username}%")
         
         if days:
             cutoff_date = datetime.utcnow() - timedelta(days=days)
-            conditions.append("created_at >= ?")
-            params.append(cutoff_date.isoformat())
-        
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
+            # Same layout as the CURRENT_TIMESTAMP default, so string comparison is correct
+            params.append(cutoff_date.isoformat(sep=' ', timespec='seconds'))
         
-        query += " ORDER BY created_at DESC"
+        # Key of the prepared query for this filter combination
+        match = ("exact" if exact else "like") if username else None
+        filters = (match, bool(days))
         
         # Add pagination
         offset = (page - 1) * per_page
-        query += f" LIMIT {per_page} OFFSET {offset}"
         
         # Execute query
         with get_db_connection() as conn:
-            cursor = conn.execute(query, params)
-            rows = cursor.fetchall()
+            # Rows only change by insert (new max id) or delete (lower count),
+            # so these two values identify the filtered result set
+            max_id, total_count = conn.execute(SQL_RESULTS_VERSION[filters], params).fetchone()
+            etag = f"{max_id or 0}-{total_count}"
+            if request.if_none_match.contains_weak(etag):
+                return json_response(None, etag)
             
-            # Get total count for pagination
-            count_query = "SELECT COUNT(*) FROM results"
-            if conditions:
-                count_query += " WHERE " + " AND ".join(conditions)
-            
-            total_count = conn.execute(count_query, params[:-2] if days else params).fetchone()[0]
-        
-        # Format results
-        results = []
-        for row in rows:
-            result = {
-                "id": row["id"],
-                "username": row["username"],
-                "confidence_score": row["confidence_score"],
-                "knowledge_score": row["knowledge_score"],
-                "final_score": row["final_score"],
-                "feedback": row["feedback"],
-                "question_answered": row["question_answered"],
-                "session_id": row["session_id"],
-                "created_at": row["created_at"]
-            }
-            results.append(result)
+            cursor = conn.cursor()
+            cursor.row_factory = None  # Plain tuples; zipped with RESULT_COLUMNS below
+            rows = cursor.execute(SQL_SELECT_RESULTS[filters], params + [per_page, offset]).fetchall()
         
         # Pagination info
         total_pages = (total_count + per_page - 1) // per_page
         
-        response = {
-            "results": results,
+        payload = orjson.dumps({
+            "results": [dict(zip(RESULT_COLUMNS, row)) for row in rows],
             "pagination": {
                 "current_page": page,
                 "per_page": per_page,
@@ -306,9 +692,9 @@ def get_results():
                 "has_next": page < total_pages,
                 "has_prev": page > 1
             }
-        }
+        })
         
-        return jsonify(response)
+        return json_response(payload, etag)
         
     except ValueError as e:
         return jsonify({"error": f"Invalid parameter: {str(e)}"}), 400
@@ -325,36 +711,30 @@ def get_user_stats(username):
     if not username or len(username) > 50:
         return jsonify({"error": "Invalid username"}), 400
     
+    stats_cache = app.extensions['stats_cache']
+    cached, generation = stats_cache.get(username)
+    
     try:
         with get_db_connection() as conn:
-            # Get user statistics
-            stats_query = '''
-                SELECT 
-                    COUNT(*) as total_attempts,
-                    AVG(confidence_score) as avg_confidence,
-                    AVG(knowledge_score) as avg_knowledge,
-                    AVG(final_score) as avg_final_score,
-                    MAX(final_score) as best_score,
-                    MIN(final_score) as worst_score,
-                    MAX(created_at) as last_attempt
-                FROM results 
-                WHERE username = ?
-            '''
-            
-            stats = conn.execute(stats_query, (username,)).fetchone()
+            # Current version of the user's results; checked on every request
+            # so writes served by other worker processes are never missed
+            last_id, total_attempts = conn.execute(SQL_USER_VERSION, (username,)).fetchone()
             
-            if stats["total_attempts"] == 0:
+            if total_attempts == 0:
                 return jsonify({"error": "No results found for this user"}), 404
             
-            # Get recent results
-            recent_query = '''
-                SELECT confidence_score, knowledge_score, final_score, created_at
-                FROM results 
-                WHERE username = ? 
-                ORDER BY created_at DESC 
-                LIMIT 5
-            '''
-            recent_results = conn.execute(recent_query, (username,)).fetchall()
+            etag = f"{last_id}-{total_attempts}"
+            if cached is not None and cached[0] == etag:
+                return json_response(cached[1], etag)
+            if request.if_none_match.contains_weak(etag):
+                return json_response(None, etag)
+            
+            # Get user statistics and recent results
+            stats = conn.execute(SQL_USER_STATS, (username, username)).fetchone()
+            
+            # Tag the body with the version it was computed from, in case a
+            # write landed between the two queries
+            etag = f"{stats['last_id']}-{stats['total_attempts']}"
             
             response = {
                 "username": username,
@@ -367,18 +747,12 @@ def get_user_stats(username):
                     "worst_score": stats["worst_score"],
                     "last_attempt": stats["last_attempt"]
                 },
-                "recent_results": [
-                    {
-                        "confidence_score": row["confidence_score"],
-                        "knowledge_score": row["knowledge_score"],
-                        "final_score": row["final_score"],
-                        "created_at": row["created_at"]
-                    }
-                    for row in recent_results
-                ]
+                "recent_results": app.json.loads(stats["recent_results"])
             }
             
-            return jsonify(response)
+            body = jsonify(response).get_data()
+            stats_cache.set(username, (etag, body), generation)
+            return json_response(body, etag)
             
     except sqlite3.Error as e:
         app.logger.error(f"Database error getting user stats: {e}")
@@ -388,14 +762,15 @@ def get_user_stats(username):
 def delete_result(result_id):
     """Delete a specific result (for cleanup purposes)."""
     try:
-        with get_db_connection() as conn:
-            cursor = conn.execute("DELETE FROM results WHERE id = ?", (result_id,))
+        with get_db_connection(write=True) as conn:
+            row = conn.execute(SQL_DELETE_RESULT, (result_id,)).fetchone()
             
-            if cursor.rowcount == 0:
+            if row is None:
                 return jsonify({"error": "Result not found"}), 404
             
             conn.commit()
         
+        app.extensions['stats_cache'].invalidate(row["username"])
         app.logger.info(f"Result {result_id} deleted")
         return jsonify({"message": "Result deleted successfully"}), 200
         
@@ -404,7 +779,8 @@ def delete_result(result_id):
         return jsonify({"error": "Failed to delete result"}), 500
 
 if __name__ == "__main__":
-    init_db()
+    # Development server only; production runs under gunicorn (see gunicorn.conf.py)
+    create_app()
     port = int(os.environ.get('PORT', 5000))
     debug = os.environ.get('FLASK_ENV') == 'development'
     
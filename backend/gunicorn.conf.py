@@ -0,0 +1,38 @@
+# Gunicorn settings for the Interview Prep API.
+# Run from this directory with: gunicorn -c gunicorn.conf.py
+import multiprocessing
+import os
+
+wsgi_app = "app:create_app()"
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
+
+# Give every request thread its own read connection by default
+os.environ.setdefault("DB_POOL_SIZE", str(threads))
+
+# Import the app once in the master so the schema is created a single time
+# before the workers fork.
+preload_app = True
+
+
+def pre_fork(server, worker):
+    # SQLite handles and the insert batcher thread do not survive fork();
+    # release the master's copies before each worker is created.
+    import app
+    app.close_db()
+
+
+def post_fork(server, worker):
+    # Background threads are not inherited, so each worker starts its own
+    # log listener and opens its own connection pool.
+    import app
+    app.start_log_listener()
+    app.init_db()
+
+
+def worker_exit(server, worker):
+    import app
+    app.close_db()
+    app.stop_log_listener()